@@ -232,6 +232,8 @@ def main(arguments: Sequence[str] | None = None) -> None:
                         dict_factory=lambda data: {
                             key: value.name
                             if isinstance(value, Enum)
+                            else value.__name__
+                            if isinstance(value, type)  # violated rules
                             else value
                             for key, value in data
                         },
@@ -7,7 +7,13 @@ error, warning, etc. See their respective documentation for further details.
 import ast
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Self, override
+from typing import TYPE_CHECKING, Self, override
+
+# Import `BaseRule` only for the language-server and any linters since
+# circular imports would become a problem otherwise. For this reason, use
+# quotations around `BaseRule` when using it as an annotation.
+if TYPE_CHECKING:
+    from linter.rules import BaseRule
 
 
 class Severity(IntEnum):
@@ -35,7 +41,7 @@ class Severity(IntEnum):
         return str(self.name)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Diagnostic:
     """A representation of diagnostics.
 
@@ -46,6 +52,8 @@ class Diagnostic:
         end_column: The ending column number of the diagnostic.
         message: The message of the diagnostic.
         severity: The severity of the diagnostic.
+        rule: The rule which was violated, in case the diagnostic originates
+            from a rule.
     """
 
     line: int
@@ -54,6 +62,7 @@ class Diagnostic:
     end_column: int
     message: str
     severity: Severity = Severity.ERROR
+    rule: "type[BaseRule] | None" = None
 
     @override
     def __str__(self) -> str:
@@ -78,6 +87,7 @@ class Diagnostic:
         | ast.type_param,
         message: str,
         severity: Severity = Severity.ERROR,
+        rule: "type[BaseRule] | None" = None,
     ) -> Self:
         """Create a diagnostic from an AST node.
 
@@ -90,6 +100,7 @@ class Diagnostic:
             message: The message for this diagnostic instance.
             severity: The severity level for this diagnostic instance.
                 (defaults to `Severity.ERROR`)
+            rule: The rule which was violated. (defaults to `None`)
 
         Returns:
             A diagnostic instance with the positional information from the node
@@ -111,4 +122,5 @@ class Diagnostic:
             ),
             message=message,
             severity=severity,
+            rule=rule,
         )
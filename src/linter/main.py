@@ -74,7 +74,12 @@ class Linter:
     certain aspects of it to lint.
 
     The current implementation does not enter any further into the syntax tree
-    upon analyzing a node which violates rules.
+    upon analyzing a node which violates rules. All rules are applied to such a
+    node nonetheless, in the order they were provided.
+
+    Rules are only applied to nodes matching their `node_types`. The rules
+    applicable to each type of node are determined once and reused for
+    subsequent nodes of that type, as well as subsequent linting runs.
 
     Note that, the entry-point-node itself is _not_ validated using those
     rules, `analyze_entry_point` may be used for this purpose.
@@ -87,12 +92,20 @@ class Linter:
     error-level, the node is skipped, even as an entry-point, i.e. no further
     diagnosis is done on this node's children.
 
+    When linting code, `may_contain_entry_point` is consulted before the
+    traversal. In case it rules out any entry-points or nodes of interest to
+    `analyze_entry_point`, the traversal is skipped entirely.
+
     Attributes:
         rules: The rules to apply to code of interest.
         is_entry_point: A function to identify entry-points.
         analyze_entry_point: A function to analyze the entry-point itself.
         extensive_diagnosis: Whether to continue searching for diagnostics
             after one was already found.
+        may_contain_entry_point: A function to quickly rule out code which
+            neither contains any entry-points nor any nodes which would result
+            in diagnostics by `analyze_entry_point`. It must only return
+            `False` in case this is certain.
         diagnostics: The list of currently found diagnostics.
     """
 
@@ -106,14 +119,21 @@ class Linter:
         new instance in that case.
 
         Attributes:
-            mappings: The mapping rules to use for translation.
-            context: `Context` object used during the traversal.
+            applicable_rules: A function to get the rules applicable to a
+                node.
+            is_entry_point: A function to identify entry-points.
+            analyze_entry_point: A function to analyze the entry-point itself.
+            extensive_diagnosis: Whether to continue searching for diagnostics
+                after one was already found.
+            diagnostics: The list of currently found diagnostics.
         """
 
         @override
         def __init__(
             self,
-            rules: Iterable[type[rules.BaseRule]],
+            applicable_rules: Callable[
+                [ast.AST], Iterable[type[rules.BaseRule]]
+            ],
             is_entry_point: Callable[[ast.AST], bool],
             analyze_entry_point: Callable[
                 [ast.AST], Iterable[Diagnostic]
@@ -123,7 +143,7 @@ class Linter:
         ):
             super().__init__(**kwargs)
 
-            self.rules = rules
+            self.applicable_rules = applicable_rules
             self.is_entry_point = is_entry_point
             self.analyze_entry_point = analyze_entry_point
             self.extensive_diagnosis = extensive_diagnosis
@@ -149,7 +169,7 @@ class Linter:
                 entry_point_diagnostics = self.analyze_entry_point(node)
                 self.diagnostics += entry_point_diagnostics
                 if not self.is_entry_point(node):
-                    if not list(ast.iter_child_nodes(node)):
+                    if next(ast.iter_child_nodes(node), None) is None:
                         # Found a leaf node outside code-of-interest.
                         self.found_outside = True
                     super().generic_visit(node)
@@ -172,7 +192,9 @@ class Linter:
             # Inside code of interest…
             diagnostics: list[Diagnostic] = [
                 diagnostic
-                for diagnostic in [rule.check(node) for rule in self.rules]
+                for diagnostic in [
+                    rule.check(node) for rule in self.applicable_rules(node)
+                ]
                 if diagnostic
             ]
             if diagnostics:
@@ -196,6 +218,7 @@ class Linter:
             [ast.AST], Iterable[Diagnostic]
         ] = lambda _: [],
         extensive_diagnosis: bool = False,
+        may_contain_entry_point: Callable[[str], bool] = lambda _: True,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
@@ -204,8 +227,44 @@ class Linter:
         self.is_entry_point = is_entry_point
         self.analyze_entry_point = analyze_entry_point
         self.extensive_diagnosis = extensive_diagnosis
+        self.may_contain_entry_point = may_contain_entry_point
 
         self._found_outside: bool = False
+        self._indexed_rules: tuple[type[rules.BaseRule], ...] = ()
+        self._rules_by_type: dict[
+            type[ast.AST], tuple[type[rules.BaseRule], ...]
+        ] = {}
+
+    def _applicable_rules(
+        self, node: ast.AST
+    ) -> tuple[type[rules.BaseRule], ...]:
+        """Get the rules which may apply to the given node.
+
+        The result is cached for the type of the node, see `_index_rules` for
+        resetting this cache.
+
+        Args:
+            node: The node for which to get the rules.
+
+        Returns:
+            The rules whose node types include the type of the node.
+        """
+        node_type = type(node)
+        applicable = self._rules_by_type.get(node_type)
+        if applicable is None:
+            applicable = self._rules_by_type[node_type] = tuple(
+                rule
+                for rule in self._indexed_rules
+                if issubclass(node_type, rule.node_types)
+            )
+        return applicable
+
+    def _index_rules(self) -> None:
+        """Reset the cache of applicable rules in case the rules changed."""
+        current = tuple(self.rules)
+        if current != self._indexed_rules:
+            self._indexed_rules = current
+            self._rules_by_type = {}
 
     def lint(self, tree: ast.AST) -> list[Diagnostic]:
         """Lint the provided node.
@@ -219,8 +278,9 @@ class Linter:
         """
         log.debug("Linting tree: %s.", _display(tree))
 
+        self._index_rules()
         traverser = self._LintingTraverser(
-            self.rules,
+            self._applicable_rules,
             self.is_entry_point,
             self.analyze_entry_point,
             self.extensive_diagnosis,
@@ -249,6 +309,12 @@ class Linter:
         except (SyntaxError, ValueError):
             log.fatal("Could not parse code: %s.", _display(code))
             sys.exit(ExitCode.PARSE_ERROR)
+        if not self.may_contain_entry_point(code):
+            log.debug("Code cannot contain any entry-points, skipping.")
+            # Any tree has at least one leaf, which is outside code-of-interest
+            # in case there are no entry-points.
+            self._found_outside = True
+            return []
         return self.lint(node)
 
     def lint_file(self, path: str) -> list[Diagnostic]:
@@ -297,6 +363,26 @@ class Linter:
         return self._found_outside
 
 
+def _is_probabilistic_program_decorator(decorator: ast.expr) -> bool:
+    """Checks whether the decorator is the probabilistic program decorator.
+
+    This accepts both, the plain decorator, i.e. `@probabilistic_program`, and
+    the decorator through attributes, i.e. `@probros.probabilistic_program`.
+
+    Args:
+        decorator: The decorator expression to check.
+
+    Returns:
+        True if the decorator's name matches `_DECORATOR_NAME`, False
+        otherwise.
+    """
+    match decorator:
+        case ast.Name(id=name) | ast.Attribute(attr=name):
+            return name == _DECORATOR_NAME
+        case _:
+            return False
+
+
 def _is_probabilistic_program_entry_point(node: ast.AST) -> bool:
     """Checks whether or not this declares a probabilistic program.
 
@@ -313,17 +399,27 @@ def _is_probabilistic_program_entry_point(node: ast.AST) -> bool:
         otherwise.
     """
     return isinstance(node, ast.FunctionDef) and any(
-        (
-            isinstance(decorator, ast.Attribute)
-            and decorator.attr == _DECORATOR_NAME
-        )
-        or (
-            isinstance(decorator, ast.Name) and decorator.id == _DECORATOR_NAME
-        )
+        _is_probabilistic_program_decorator(decorator)
         for decorator in node.decorator_list
     )
 
 
+def _may_contain_probabilistic_program(code: str) -> bool:
+    """Checks whether the code could declare any probabilistic program.
+
+    Both, the identification and the analysis of entry-points only concern
+    decorated definitions. Decorators cannot be used without the `@` symbol,
+    any code lacking it is therefore of no interest.
+
+    Args:
+        code: The code to check.
+
+    Returns:
+        False in case the code does not contain any decorators, True otherwise.
+    """
+    return "@" in code
+
+
 def _analyze_probabilistic_program_entry_point(
     node: ast.AST,
 ) -> Iterable[Diagnostic]:
@@ -342,13 +438,7 @@ def _analyze_probabilistic_program_entry_point(
         A list of diagnostics for all unrecognized decorators.
     """
     if (isinstance(node, (ast.ClassDef, ast.AsyncFunctionDef))) and any(
-        (
-            isinstance(decorator, ast.Attribute)
-            and decorator.attr == _DECORATOR_NAME
-        )
-        or (
-            isinstance(decorator, ast.Name) and decorator.id == _DECORATOR_NAME
-        )
+        _is_probabilistic_program_decorator(decorator)
         for decorator in node.decorator_list
     ):
         return [
@@ -390,13 +480,7 @@ def _analyze_probabilistic_program_entry_point(
 
     # In case the entry-point is valid…
     if any(
-        (
-            isinstance(decorator, ast.Attribute)
-            and decorator.attr == _DECORATOR_NAME
-        )
-        or (
-            isinstance(decorator, ast.Name) and decorator.id == _DECORATOR_NAME
-        )
+        _is_probabilistic_program_decorator(decorator)
         for decorator in node.decorator_list
     ):
         # warn about discouraged argument-types.
@@ -449,7 +533,7 @@ def default_probabilistic_program_linter() -> Linter:
         probabilistic programs.
     """
     return Linter(
-        {
+        [
             # Statement rules.
             rules.NoNestedFunctionsRule,
             rules.NoNestedClassesRule,
@@ -497,7 +581,8 @@ def default_probabilistic_program_linter() -> Linter:
             rules.RestrictIndexedAddressCallStructureRule,
             rules.RestrictVectorConstructorCallStructureRule,
             rules.RestrictArrayConstructorCallStructureRule,
-        },
+        ],
         _is_probabilistic_program_entry_point,
         _analyze_probabilistic_program_entry_point,
+        may_contain_entry_point=_may_contain_probabilistic_program,
     )
@@ -9,7 +9,7 @@ components.
 import ast
 from abc import ABC, abstractmethod
 
-from linter import Diagnostic
+from linter import Diagnostic, Severity
 
 
 class BaseRule(ABC):
@@ -17,14 +17,20 @@ class BaseRule(ABC):
 
     This class serves as a blueprint for creating specific rules that check for
     issues in the nodes. Each rule must override the `message` attribute and
-    implement the `check` method.
+    implement the `check` method. Rules which only apply to certain types of
+    nodes should override the `node_types` attribute, this allows the linter
+    to skip the rule for any other nodes.
 
     Attributes:
         message: A description of the rule, which may be used for diagnostic
             messages in case the rule is violated.
+        node_types: The types of nodes the rule may apply to, `check` must not
+            return any diagnostic for nodes of any other type. (defaults to
+            all nodes)
     """
 
     message: str
+    node_types: tuple[type[ast.AST], ...] = (ast.AST,)
 
     @classmethod
     @abstractmethod
@@ -32,9 +38,9 @@ class BaseRule(ABC):
         """Check the given node for violations of a rule.
 
         This method must be implemented by subclasses to define the specific
-        logic for checking the given node. If any message is used for any
-        diagnostics or feedback, use the `message` attribute of the `cls`
-        argument.
+        logic for checking the given node. Diagnostics should be created using
+        the `diagnostic` method, which uses the `message` attribute of the
+        `cls` argument.
 
         Args:
             node: The AST node to check.
@@ -44,3 +50,27 @@ class BaseRule(ABC):
             `None`.
         """
         raise NotImplementedError("Subclasses must implement this.")
+
+    @classmethod
+    def diagnostic(
+        cls,
+        node: ast.AST,
+        severity: Severity = Severity.ERROR,
+    ) -> Diagnostic:
+        """Create a diagnostic for a violation of this rule.
+
+        Args:
+            node: The node which violates this rule.
+            severity: The severity of the violation. (defaults to
+                `Severity.ERROR`)
+
+        Returns:
+            A diagnostic with the positional information of the node, the
+            `message` of this rule, and a reference to this rule.
+        """
+        return Diagnostic.from_node(
+            node,
+            message=cls.message,
+            severity=severity,
+            rule=cls,
+        )
@@ -15,35 +15,33 @@ from .base import BaseRule
 
 
 class RestrictBinaryOperatorsRule(BaseRule):
+    _OPERATORS = frozenset(
+        {ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow}
+    )
+
     # Prohibit shift and bitwise operators.
     message = "Binary operators may only be of: +, -, *, /, //, %, **"
+    node_types = (ast.BinOp,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.BinOp):
+        if not isinstance(node, ast.BinOp) or type(node.op) in cls._OPERATORS:
             return None
-        match node.op:
-            case (
-                ast.Add()
-                | ast.Sub()
-                | ast.Mult()
-                | ast.Div()
-                | ast.FloorDiv()
-                | ast.Mod()
-                | ast.Pow()
-            ):
-                return None
-            case _:
-                return Diagnostic.from_node(node, message=cls.message)
+        return cls.diagnostic(node)
 
 
 class RestrictComparisonOperatorsRule(BaseRule):
+    _OPERATORS = frozenset(
+        {ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE}
+    )
+
     # Prohibit `is`, `is not`, `in`, `not in`.
     message = (
         "Comparison operators may only be binary and one of: "
         "==, !=, <, <=, >, >="
     )
+    node_types = (ast.Compare,)
 
     @override
     @classmethod
@@ -52,35 +50,30 @@ class RestrictComparisonOperatorsRule(BaseRule):
             return None
         match node:
             case ast.Compare(
-                ops=[
-                    ast.Eq()
-                    | ast.NotEq()
-                    | ast.Lt()
-                    | ast.LtE()
-                    | ast.Gt()
-                    | ast.GtE()
-                ],
-                comparators=comparators,
-            ) if len(comparators) == 1:
+                ops=[operator],
+                comparators=[_],
+            ) if type(operator) in cls._OPERATORS:
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictUnaryOperatorsRule(BaseRule):
+    _OPERATORS = frozenset({ast.UAdd, ast.USub, ast.Not})
+
     # Prohibit the bitwise complement operator `~`.
     message = "Unary operators may only be of: +, -, not"
+    node_types = (ast.UnaryOp,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.UnaryOp):
+        if (
+            not isinstance(node, ast.UnaryOp)
+            or type(node.op) in cls._OPERATORS
+        ):
             return None
-        match node.op:
-            case ast.UAdd() | ast.USub() | ast.Not():
-                return None
-            case _:
-                return Diagnostic.from_node(node, message=cls.message)
+        return cls.diagnostic(node)
 
 
 # Prohibit inline statements. #################################################
@@ -88,41 +81,34 @@ class RestrictUnaryOperatorsRule(BaseRule):
 
 class NoWalrusOperatorRule(BaseRule):
     message = "Walrus operators are prohibited"
+    node_types = (ast.NamedExpr,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.NamedExpr)
-            else None
+            cls.diagnostic(node) if isinstance(node, ast.NamedExpr) else None
         )
 
 
 class NoLambdaRule(BaseRule):
     message = "Lambda expressions are prohibited"
+    node_types = (ast.Lambda,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Lambda)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Lambda) else None
 
 
 class NoInlineIfRule(BaseRule):
     message = "Inline if expressions are prohibited"
+    node_types = (ast.IfExp,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.IfExp)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.IfExp) else None
 
 
 # Restrict available data-structure. ##########################################
@@ -130,38 +116,41 @@ class NoInlineIfRule(BaseRule):
 
 class NoDictionaryRule(BaseRule):
     message = "Dictionaries are prohibited"
+    node_types = (ast.Dict, ast.Call)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         match node:
             case ast.Dict() | ast.Call(func=ast.Name(id="dict")):
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case _:
                 return None
 
 
 class NoSetRule(BaseRule):
     message = "Sets are prohibited"
+    node_types = (ast.Set, ast.Call)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         match node:
             case ast.Set() | ast.Call(func=ast.Name(id="set")):
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case _:
                 return None
 
 
 class NoComprehensionAndGeneratorRule(BaseRule):
     message = "Comprehensions are prohibited"
+    node_types = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(
                 node,
                 (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp),
@@ -175,32 +164,40 @@ class NoComprehensionAndGeneratorRule(BaseRule):
 
 class NoAsynchronousExpressionRule(BaseRule):
     message = "Asynchronous expressions are prohibited"
+    node_types = (
+        ast.Await,
+        ast.ListComp,
+        ast.SetComp,
+        ast.DictComp,
+        ast.GeneratorExp,
+    )
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         match node:
             case ast.Await():
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case (
                 ast.ListComp(generators=generators)
                 | ast.SetComp(generators=generators)
                 | ast.DictComp(generators=generators)
                 | ast.GeneratorExp(generators=generators)
             ) if any(generator.is_async for generator in generators):
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case _:
                 return None
 
 
 class NoYieldRule(BaseRule):
     message = "Yields are prohibited"
+    node_types = (ast.Yield, ast.YieldFrom)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.Yield, ast.YieldFrom))
             else None
         )
@@ -211,38 +208,35 @@ class NoYieldRule(BaseRule):
 
 class NoFstringRule(BaseRule):
     message = "F-Strings are prohibited"
+    node_types = (ast.JoinedStr,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.JoinedStr)
-            else None
+            cls.diagnostic(node) if isinstance(node, ast.JoinedStr) else None
         )
 
 
 class NoStarredRule(BaseRule):
     message = "Starred variables are prohibited"
+    node_types = (ast.Starred,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Starred)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Starred) else None
 
 
 class NoTypeParameterRule(BaseRule):
     message = "Type parameters are prohibited"
+    node_types = (ast.TypeVar, ast.TypeVarTuple, ast.ParamSpec)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.TypeVar, ast.TypeVarTuple, ast.ParamSpec))
             else None
         )
@@ -253,6 +247,7 @@ class NoTypeParameterRule(BaseRule):
 
 class RestrictSlicesRule(BaseRule):
     message = "Slices may only be of the form `:`"
+    node_types = (ast.Slice,)
 
     @override
     @classmethod
@@ -261,6 +256,6 @@ class RestrictSlicesRule(BaseRule):
             case ast.Slice(lower=None, upper=None, step=None):
                 return None
             case ast.Slice():
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case _:
                 return None
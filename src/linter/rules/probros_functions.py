@@ -10,7 +10,7 @@ from typing import override
 from linter import Diagnostic
 
 from .base import BaseRule
-from .utils import Address, Distribution, is_function_called
+from .utils import Address, Distribution, called_name
 
 
 class RestrictSampleCallStructureRule(BaseRule):
@@ -21,13 +21,12 @@ class RestrictSampleCallStructureRule(BaseRule):
         f"<{Address.representation()}>"
         f", <{Distribution.representation()}>)`"
     )
+    node_types = (ast.Call,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.Call) or not is_function_called(
-            node, cls._NAME
-        ):
+        if called_name(node) != cls._NAME:
             return None
         match node:
             case ast.Call(
@@ -41,7 +40,7 @@ class RestrictSampleCallStructureRule(BaseRule):
             ):
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictObserveCallStructureRule(BaseRule):
@@ -54,13 +53,12 @@ class RestrictObserveCallStructureRule(BaseRule):
         f"[, [{_ADDRESS}=]<{Address.representation()}>"
         f"[, [{_DISTRIBUTION}=]<{Distribution.representation()}>]])`"
     )
+    node_types = (ast.Call,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.Call) or not is_function_called(
-            node, cls._NAME
-        ):
+        if called_name(node) != cls._NAME:
             return None
         match node:
             # Only `data`.
@@ -135,7 +133,7 @@ class RestrictObserveCallStructureRule(BaseRule):
             ):
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictFactorCallStructureRule(BaseRule):
@@ -148,13 +146,12 @@ class RestrictFactorCallStructureRule(BaseRule):
         f"[, [{_ADDRESS}=]<{Address.representation()}>])"
     )
     # fmt: on
+    node_types = (ast.Call,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.Call) or not is_function_called(
-            node, cls._NAME
-        ):
+        if called_name(node) != cls._NAME:
             return None
         match node:
             # No address given.
@@ -173,20 +170,19 @@ class RestrictFactorCallStructureRule(BaseRule):
             ) if Address.is_address(address):
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictIndexedAddressCallStructureRule(BaseRule):
     _NAME = "IndexedAddress"
 
     message = f"Usage: `{_NAME}(<address>, <index>, …)`"
+    node_types = (ast.Call,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.Call) or not is_function_called(
-            node, cls._NAME
-        ):
+        if called_name(node) != cls._NAME:
             return None
         match node:
             case ast.Call(
@@ -195,7 +191,7 @@ class RestrictIndexedAddressCallStructureRule(BaseRule):
             ) if Address.is_address(address) and indices:
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictVectorConstructorCallStructureRule(BaseRule):
@@ -210,13 +206,12 @@ class RestrictVectorConstructorCallStructureRule(BaseRule):
         f"[, [{_TYPE}=]<data>]])`"
     )
     # fmt: on
+    node_types = (ast.Call,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.Call) or not is_function_called(
-            node, cls._NAME
-        ):
+        if called_name(node) != cls._NAME:
             return None
         match node:
             case (
@@ -257,7 +252,7 @@ class RestrictVectorConstructorCallStructureRule(BaseRule):
             ):
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictArrayConstructorCallStructureRule(BaseRule):
@@ -272,13 +267,12 @@ class RestrictArrayConstructorCallStructureRule(BaseRule):
         f"[, [{_TYPE}=]<data>]])`"
     )
     # fmt: on
+    node_types = (ast.Call,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        if not isinstance(node, ast.Call) or not is_function_called(
-            node, cls._NAME
-        ):
+        if called_name(node) != cls._NAME:
             return None
         match node:
             case (
@@ -319,4 +313,4 @@ class RestrictArrayConstructorCallStructureRule(BaseRule):
             ):
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
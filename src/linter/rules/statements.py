@@ -10,19 +10,20 @@ from typing import override
 from linter import Diagnostic, Severity
 
 from .base import BaseRule
-from .utils import is_function_called
+from .utils import called_name
 
 # Prohibit nested definitions and imports. ####################################
 
 
 class NoNestedFunctionsRule(BaseRule):
     message = "Nested functions are prohibited"
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
             else None
         )
@@ -30,25 +31,23 @@ class NoNestedFunctionsRule(BaseRule):
 
 class NoNestedClassesRule(BaseRule):
     message = "Nested classes are prohibited"
+    node_types = (ast.ClassDef,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.ClassDef)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.ClassDef) else None
 
 
 class NoImportRule(BaseRule):
     message = "Importing is prohibited"
+    node_types = (ast.Import, ast.ImportFrom)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.Import, ast.ImportFrom))
             else None
         )
@@ -56,12 +55,13 @@ class NoImportRule(BaseRule):
 
 class NoGlobalOrNonlocalDeclarationRule(BaseRule):
     message = "Declaring global variables is prohibited"
+    node_types = (ast.Global, ast.Nonlocal)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.Global, ast.Nonlocal))
             else None
         )
@@ -72,32 +72,29 @@ class NoGlobalOrNonlocalDeclarationRule(BaseRule):
 
 class NoDeleteStatementRule(BaseRule):
     message = "Delete statements are prohibited"
+    node_types = (ast.Delete,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Delete)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Delete) else None
 
 
 class NoTypeAliasRule(BaseRule):
     message = "Type aliasing is prohibited"
+    node_types = (ast.TypeAlias,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.TypeAlias)
-            else None
+            cls.diagnostic(node) if isinstance(node, ast.TypeAlias) else None
         )
 
 
 class NoDeconstructorRule(BaseRule):
     message = "Deconstructors are prohibited"
+    node_types = (ast.Assign,)
 
     @override
     @classmethod
@@ -105,7 +102,7 @@ class NoDeconstructorRule(BaseRule):
         # Deconstruction can only occur on `Assign`, `AnnAssign` (annotated
         # assign) and `AugAssign` (augmented assign) cannot use deconstructors.
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, ast.Assign)
             and any(
                 isinstance(target, (ast.Tuple, ast.List))
@@ -117,12 +114,13 @@ class NoDeconstructorRule(BaseRule):
 
 class NoChainedAssignmentRule(BaseRule):
     message = "Chained assignments are prohibited"
+    node_types = (ast.Assign,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, ast.Assign) and len(node.targets) > 1
             else None
         )
@@ -130,29 +128,25 @@ class NoChainedAssignmentRule(BaseRule):
 
 class NoAugmentedAssignRule(BaseRule):
     message = "Augmented assigns are prohibited"
+    node_types = (ast.AugAssign,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.AugAssign)
-            else None
+            cls.diagnostic(node) if isinstance(node, ast.AugAssign) else None
         )
 
 
 class WarnAnnotatedAssignRule(BaseRule):
     message = "Annotated assigns are discouraged"
+    node_types = (ast.AnnAssign,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(
-                node,
-                message=cls.message,
-                severity=Severity.WARNING,
-            )
+            cls.diagnostic(node, severity=Severity.WARNING)
             if isinstance(node, ast.AnnAssign)
             else None
         )
@@ -160,6 +154,7 @@ class WarnAnnotatedAssignRule(BaseRule):
 
 class NoAttributeAssignRule(BaseRule):
     message = "Attributes may not be written to"
+    node_types = (ast.Assign, ast.AnnAssign, ast.AugAssign)
 
     @override
     @classmethod
@@ -168,12 +163,12 @@ class NoAttributeAssignRule(BaseRule):
             case ast.Assign(targets=targets) if any(
                 isinstance(target, ast.Attribute) for target in targets
             ):
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case (
                 ast.AnnAssign(target=ast.Attribute())
                 | ast.AugAssign(target=ast.Attribute())
             ):
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
             case _:
                 return None
 
@@ -182,7 +177,10 @@ class NoAttributeAssignRule(BaseRule):
 
 
 class NoStandaloneExpressionRule(BaseRule):
+    _NAMES = frozenset({"observe", "factor"})
+
     message = "Expressions may not appear as statements"
+    node_types = (ast.Expr,)
 
     @override
     @classmethod
@@ -190,17 +188,15 @@ class NoStandaloneExpressionRule(BaseRule):
         if not isinstance(node, ast.Expr):
             return None
         match node:
-            case ast.Expr(value=value) if any(
-                is_function_called(value, name)
-                for name in ("observe", "factor")
-            ):
+            case ast.Expr(value=value) if called_name(value) in cls._NAMES:
                 return None
             case _:
-                return Diagnostic.from_node(node, message=cls.message)
+                return cls.diagnostic(node)
 
 
 class RestrictForLoopIteratorRule(BaseRule):
     message = "For-loops may only use `range`"
+    node_types = (ast.For, ast.AsyncFor)
 
     @override
     @classmethod
@@ -211,17 +207,18 @@ class RestrictForLoopIteratorRule(BaseRule):
             case ast.Call(func=ast.Name(id="range")):
                 return None
             case _:
-                return Diagnostic.from_node(node.iter, message=cls.message)
+                return cls.diagnostic(node.iter)
 
 
 class NoForElseRule(BaseRule):
     message = "For-loops may not have `else` blocks"
+    node_types = (ast.For, ast.AsyncFor)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.For, ast.AsyncFor)) and node.orelse
             else None
         )
@@ -229,12 +226,13 @@ class NoForElseRule(BaseRule):
 
 class NoWhileElseRule(BaseRule):
     message = "While-loops may not have `else` blocks"
+    node_types = (ast.While,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, ast.While) and node.orelse
             else None
         )
@@ -242,12 +240,13 @@ class NoWhileElseRule(BaseRule):
 
 class NoWithStatementRule(BaseRule):
     message = "With statements are prohibited"
+    node_types = (ast.With, ast.AsyncWith)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.With, ast.AsyncWith))
             else None
         )
@@ -255,25 +254,23 @@ class NoWithStatementRule(BaseRule):
 
 class NoMatchRule(BaseRule):
     message = "The match control-flow construct is prohibited"
+    node_types = (ast.Match,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Match)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Match) else None
 
 
 class NoAsynchronousStatementRule(BaseRule):
     message = "Asynchronous statements are prohibited"
+    node_types = (ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(
                 node, (ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith)
             )
@@ -283,25 +280,23 @@ class NoAsynchronousStatementRule(BaseRule):
 
 class NoPassRule(BaseRule):
     message = "Pass statements are prohibited"
+    node_types = (ast.Pass,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Pass)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Pass) else None
 
 
 class NoEmptyReturnRule(BaseRule):
     message = "Empty returns are prohibited"
+    node_types = (ast.Return,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, ast.Return) and not node.value
             else None
         )
@@ -312,25 +307,23 @@ class NoEmptyReturnRule(BaseRule):
 
 class NoRaiseExceptionRule(BaseRule):
     message = "Raising exceptions is prohibited"
+    node_types = (ast.Raise,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Raise)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Raise) else None
 
 
 class NoTryExceptRule(BaseRule):
     message = "The try-except control-flow is prohibited"
+    node_types = (ast.Try, ast.TryStar)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
         return (
-            Diagnostic.from_node(node, message=cls.message)
+            cls.diagnostic(node)
             if isinstance(node, (ast.Try, ast.TryStar))
             else None
         )
@@ -338,12 +331,9 @@ class NoTryExceptRule(BaseRule):
 
 class NoAssertRule(BaseRule):
     message = "Assertions are prohibited"
+    node_types = (ast.Assert,)
 
     @override
     @classmethod
     def check(cls, node: ast.AST) -> Diagnostic | None:
-        return (
-            Diagnostic.from_node(node, message=cls.message)
-            if isinstance(node, ast.Assert)
-            else None
-        )
+        return cls.diagnostic(node) if isinstance(node, ast.Assert) else None
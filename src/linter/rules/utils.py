@@ -45,6 +45,26 @@ def is_function_called(
             return False
 
 
+def called_name(node: ast.AST) -> str | None:
+    """Get the name of the function called by the given node.
+
+    Like `is_function_called`, this covers both, direct function calls, i.e.
+    `myname(...)`, and calls through attributes, i.e. `mypackage.myname(...)`.
+
+    Args:
+        node: The AST node to check.
+
+    Returns:
+        str | None: The name of the called function, or `None` if the node is
+        not a call to a (named) function.
+    """
+    match node:
+        case ast.Call(func=(ast.Name(id=called) | ast.Attribute(attr=called))):
+            return called
+        case _:
+            return None
+
+
 class classproperty(property):
     """A decorator to create class-level properties.
 
@@ -125,28 +145,30 @@ class Distribution:
     features and should not be instantiated.
     """
 
-    _DISTRIBUTIONS = [
-        "Dirac",
-        "Beta",
-        "Cauchy",
-        "Exponential",
-        "Gamma",
-        "HalfCauchy",
-        "HalfNormal",
-        "InverseGamma",
-        "Normal",
-        "StudentT",
-        "Uniform",
-        "Bernoulli",
-        "Binomial",
-        "DiscreteUniform",
-        "Geometric",
-        "HyperGeometric",
-        "Poisson",
-        "Dirichlet",
-        "MultivariateNormal",
-        "Categorical",
-    ]
+    _DISTRIBUTIONS = frozenset(
+        {
+            "Dirac",
+            "Beta",
+            "Cauchy",
+            "Exponential",
+            "Gamma",
+            "HalfCauchy",
+            "HalfNormal",
+            "InverseGamma",
+            "Normal",
+            "StudentT",
+            "Uniform",
+            "Bernoulli",
+            "Binomial",
+            "DiscreteUniform",
+            "Geometric",
+            "HyperGeometric",
+            "Poisson",
+            "Dirichlet",
+            "MultivariateNormal",
+            "Categorical",
+        }
+    )
 
     @classproperty
     def _WRAPPING_DISTRIBUTIONS(
@@ -222,10 +244,7 @@ class Distribution:
         Returns:
             `True` if the node represents a distribution, `False` otherwise.
         """
-        return any(
-            is_function_called(node, distribution)
-            for distribution in cls._DISTRIBUTIONS
-        )
+        return called_name(node) in cls._DISTRIBUTIONS
 
     @classmethod
     def representation(cls) -> str:
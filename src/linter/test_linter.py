@@ -17,12 +17,23 @@ The names of the test-cases generally follow the following pattern:
 
 Fixtures:
     - default_linter: A `pytest` fixture that provides a default instance of
-        the probabilistic program linter.
+        the probabilistic program linter. It is shared across the session, so
+        tests must not leave it modified.
+    - extensive_linter: A `pytest` fixture that provides the default linter
+        with extensive diagnosis enabled for the duration of one test.
+    - snippet_nodes: A `pytest` fixture that provides all nodes of the code
+        snippets in this file.
 """
 
+import ast
+from collections import Counter
+from pathlib import Path
+from typing import override
+
 import pytest
 
 from linter import (
+    Diagnostic,
     Linter,
     Severity,
     default_probabilistic_program_linter,
@@ -30,49 +41,77 @@ from linter import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_linter() -> Linter:
     return default_probabilistic_program_linter()
 
 
+@pytest.fixture
+def extensive_linter(
+    default_linter: Linter, monkeypatch: pytest.MonkeyPatch
+) -> Linter:
+    monkeypatch.setattr(default_linter, "extensive_diagnosis", True)
+    return default_linter
+
+
+@pytest.fixture(scope="session")
+def snippet_nodes() -> list[ast.AST]:
+    nodes: list[ast.AST] = []
+    for node in ast.walk(ast.parse(Path(__file__).read_text())):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            try:
+                nodes.extend(ast.walk(ast.parse(node.value)))
+            except SyntaxError:
+                continue
+    return nodes
+
+
+def assert_errors(
+    diagnostics: list[Diagnostic], *violated: type[rules.BaseRule]
+) -> None:
+    assert Counter(
+        (diagnostic.severity, diagnostic.rule) for diagnostic in diagnostics
+    ) == Counter((Severity.ERROR, rule) for rule in violated)
+
+
 class TestEntryPointRecognition:
     class TestUnrecognizedDecoratorWarning:
         @staticmethod
-        def test_unrecognized_decorator_addition(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @1 + 1
 def test_unrecognized_decorator_addition():
     pass
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.WARNING
-
-        @staticmethod
-        def test_unrecognized_decorator_string(default_linter: Linter) -> None:
-            code = """
+                    """,
+                    id="addition",
+                ),
+                pytest.param(
+                    """
 @"hello decorator!"
 def test_unrecognized_decorator_string():
     pass
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.WARNING
-
-        @staticmethod
-        def test_unrecognized_decorator_matching_string(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="string",
+                ),
+                pytest.param(
+                    """
 @"probabilistic_program"
 def test_unrecognized_decorator_matching_string():
     pass
-            """
+                    """,
+                    id="matching_string",
+                ),
+            ],
+        )
+        def test_unrecognized_decorator(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
             assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.WARNING
+            assert diagnostics[0].severity is Severity.WARNING
 
     class TestInvalidEntryPoints:
         @staticmethod
@@ -88,56 +127,49 @@ def test_valid_entry_point_positional_only_arguments(a, b, /, c):
             assert not diagnostics
 
         @staticmethod
-        def test_invalid_entry_point_keyword_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @probabilistic_program
 def test_invalid_entry_point_keyword_argument(data=None):
     return data
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-
-        @staticmethod
-        def test_invalid_entry_point_keyword_only_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="keyword_argument",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_invalid_entry_point_keyword_only_argument(a, *args, b):
     return a * b
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-
-        @staticmethod
-        def test_invalid_entry_point_catch_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="keyword_only_argument",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_invalid_entry_point_catch_argument(data, *args):
     return data
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-
-        @staticmethod
-        def test_invalid_entry_point_catch_keyword_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="catch_argument",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_invalid_entry_point_catch_keyword_argument(data, **kwargs):
     return data
-            """
+                    """,
+                    id="catch_keyword_argument",
+                ),
+            ],
+        )
+        def test_invalid_entry_point(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
             assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
+            assert diagnostics[0].severity is Severity.ERROR
 
         @staticmethod
         def test_warned_entry_point_typing(
@@ -150,7 +182,7 @@ def test_warned_entry_point_typing(data: list[int]):
             """
             diagnostics = default_linter.lint_code(code)
             assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.WARNING
+            assert diagnostics[0].severity is Severity.WARNING
 
         @staticmethod
         def test_warned_entry_point_typed_keyword_argument(
@@ -231,14 +263,11 @@ def test_invalid_probabilistic_program(data):
     return probability
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            assert_errors(
+                diagnostics,
+                rules.NoFstringRule,
+                rules.RestrictObserveCallStructureRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoFstringRule.message in messages
-            assert rules.RestrictObserveCallStructureRule.message in messages
 
         @staticmethod
         def test_valid_probabilistic_class_method(
@@ -280,14 +309,11 @@ class TestProhibitedFstringInClassMethod:
                 count = count + 1
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            assert_errors(
+                diagnostics,
+                rules.NoFstringRule,
+                rules.RestrictSampleCallStructureRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoFstringRule.message in messages
-            assert rules.RestrictSampleCallStructureRule.message in messages
 
         @staticmethod
         def test_valid_probabilistic_program_in_function(
@@ -324,14 +350,11 @@ def test_prohibited_fstring_in_function_outer():
             )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            assert_errors(
+                diagnostics,
+                rules.NoFstringRule,
+                rules.RestrictObserveCallStructureRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoFstringRule.message in messages
-            assert rules.RestrictObserveCallStructureRule.message in messages
 
 
 class TestStatementLinting:
@@ -355,11 +378,7 @@ def test_prohibited_nested_function(data):
     return test_prohibited_nested_function_nested()
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoNestedFunctionsRule.message
-            )
+            assert_errors(diagnostics, rules.NoNestedFunctionsRule)
 
         @staticmethod
         def test_prohibited_nested_class(default_linter: Linter) -> None:
@@ -372,9 +391,7 @@ def test_prohibited_nested_class():
     return TestProhibitedNestedClassNested.pi
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoNestedClassesRule.message
+            assert_errors(diagnostics, rules.NoNestedClassesRule)
 
         @staticmethod
         def test_prohibited_import(default_linter: Linter) -> None:
@@ -386,9 +403,7 @@ def test_prohibited_import(degrees):
     return math.radians(degrees)
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoImportRule.message
+            assert_errors(diagnostics, rules.NoImportRule)
 
         @staticmethod
         def test_prohibited_import_from(default_linter: Linter) -> None:
@@ -400,9 +415,7 @@ def test_prohibited_import_from():
     return randint(0, 10)
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoImportRule.message
+            assert_errors(diagnostics, rules.NoImportRule)
 
         @staticmethod
         def test_prohibited_gloabl(default_linter: Linter) -> None:
@@ -413,12 +426,7 @@ def test_prohibited_gloabl():
     x = 23
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoGlobalOrNonlocalDeclarationRule.message
-            )
+            assert_errors(diagnostics, rules.NoGlobalOrNonlocalDeclarationRule)
 
         @staticmethod
         def test_prohibited_nonlocal(default_linter: Linter) -> None:
@@ -429,12 +437,7 @@ def test_prohibited_nonlocal():
     x = 23
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoGlobalOrNonlocalDeclarationRule.message
-            )
+            assert_errors(diagnostics, rules.NoGlobalOrNonlocalDeclarationRule)
 
     class TestRestrictedVariableManipulation:
         @staticmethod
@@ -453,11 +456,7 @@ def test_prohibited_delete(data):
     del sum
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoDeleteStatementRule.message
-            )
+            assert_errors(diagnostics, rules.NoDeleteStatementRule)
 
         @staticmethod
         def test_prohibited_type_aliasing(default_linter: Linter) -> None:
@@ -473,13 +472,13 @@ def test_prohibited_type_aliasing():
             diagnostics = default_linter.lint_code(code)
             assert len(diagnostics) == 2
             assert any(
-                diagnostic.severity == Severity.ERROR
-                and diagnostic.message == rules.NoTypeAliasRule.message
+                diagnostic.severity is Severity.ERROR
+                and diagnostic.rule is rules.NoTypeAliasRule
                 for diagnostic in diagnostics
             )
             assert any(
-                diagnostic.severity == Severity.WARNING
-                and diagnostic.message == rules.WarnAnnotatedAssignRule.message
+                diagnostic.severity is Severity.WARNING
+                and diagnostic.rule is rules.WarnAnnotatedAssignRule
                 for diagnostic in diagnostics
             )
 
@@ -512,9 +511,7 @@ def test_prohibited_deconstructor(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoDeconstructorRule.message
+            assert_errors(diagnostics, rules.NoDeconstructorRule)
 
         @staticmethod
         def test_prohibited_augmented_assign_addition(
@@ -526,11 +523,7 @@ def test_prohibited_augmented_assign_addition(probability):
     probability += 0.01
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoAugmentedAssignRule.message
-            )
+            assert_errors(diagnostics, rules.NoAugmentedAssignRule)
 
         @staticmethod
         def test_prohibited_augmented_assign_and_bitwise(
@@ -542,11 +535,7 @@ def test_prohibited_augmented_assign_and_bitwise(probability):
     probability ^= 0b1010
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoAugmentedAssignRule.message
-            )
+            assert_errors(diagnostics, rules.NoAugmentedAssignRule)
 
         @staticmethod
         def test_prohibited_augmented_assign_division(
@@ -558,11 +547,7 @@ def test_prohibited_augmented_assign_division(probability):
     probability /= 2
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoAugmentedAssignRule.message
-            )
+            assert_errors(diagnostics, rules.NoAugmentedAssignRule)
 
         @staticmethod
         def test_prohibited_augmented_assign_power(
@@ -574,11 +559,7 @@ def test_prohibited_augmented_assign_power(probability):
     probability **= 2
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoAugmentedAssignRule.message
-            )
+            assert_errors(diagnostics, rules.NoAugmentedAssignRule)
 
         @staticmethod
         def test_warned_annotated_assign_int(default_linter: Linter) -> None:
@@ -589,10 +570,8 @@ def test_warned_annotated_assign_int(a):
             """
             diagnostics = default_linter.lint_code(code)
             assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.WARNING
-            assert (
-                diagnostics[0].message == rules.WarnAnnotatedAssignRule.message
-            )
+            assert diagnostics[0].severity is Severity.WARNING
+            assert diagnostics[0].rule is rules.WarnAnnotatedAssignRule
 
         @staticmethod
         def test_prohibited_chained_assign(default_linter: Linter) -> None:
@@ -602,11 +581,7 @@ def test_prohibited_chained_assign(data):
     x = y = data
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoChainedAssignmentRule.message
-            )
+            assert_errors(diagnostics, rules.NoChainedAssignmentRule)
 
         @staticmethod
         def test_prohibited_attribute_assign(default_linter: Linter) -> None:
@@ -617,11 +592,7 @@ def test_prohibited_attribute_assign(data):
     return data.sum
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message == rules.NoAttributeAssignRule.message
-            )
+            assert_errors(diagnostics, rules.NoAttributeAssignRule)
 
     class TestRestrictedControlFlowStructures:
         @staticmethod
@@ -662,12 +633,7 @@ def test_prohibited_standalone_expression_function_call(n):
     initialize_context()
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoStandaloneExpressionRule.message
-            )
+            assert_errors(diagnostics, rules.NoStandaloneExpressionRule)
 
         @staticmethod
         def test_prohibited_standalone_expression_calculations(
@@ -679,12 +645,7 @@ def test_prohibited_standalone_expression_calculations(n):
     1 + 2**3 / 4 // 5
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoStandaloneExpressionRule.message
-            )
+            assert_errors(diagnostics, rules.NoStandaloneExpressionRule)
 
         @staticmethod
         def test_restricted_for_iterable(default_linter: Linter) -> None:
@@ -702,12 +663,7 @@ def test_restricted_for_iterable(data):
             return "inside X and Y"
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictForLoopIteratorRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictForLoopIteratorRule)
 
         @staticmethod
         def test_restricted_for_iterable_constant(
@@ -722,12 +678,7 @@ def test_restricted_for_iterable_constant(data):
         step += 1
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictForLoopIteratorRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictForLoopIteratorRule)
 
         @staticmethod
         def test_prohibited_for_else(default_linter: Linter) -> None:
@@ -740,9 +691,7 @@ def test_prohibited_for_else(data):
         myvar = "hello"
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoForElseRule.message
+            assert_errors(diagnostics, rules.NoForElseRule)
 
         @staticmethod
         def test_prohibited_while_else(default_linter: Linter) -> None:
@@ -755,9 +704,7 @@ def test_prohibited_while_else(data):
         myvar = "hello"
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoWhileElseRule.message
+            assert_errors(diagnostics, rules.NoWhileElseRule)
 
         @staticmethod
         def test_prohibited_with_file(default_linter: Linter) -> None:
@@ -774,9 +721,7 @@ def test_prohibited_with_file(filepath):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoWithStatementRule.message
+            assert_errors(diagnostics, rules.NoWithStatementRule)
 
         @staticmethod
         def test_prohibited_with_variables(default_linter: Linter) -> None:
@@ -792,9 +737,7 @@ def test_prohibited_with_variables(generator):
             )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoWithStatementRule.message
+            assert_errors(diagnostics, rules.NoWithStatementRule)
 
         @staticmethod
         def test_prohibited_match(default_linter: Linter) -> None:
@@ -808,13 +751,11 @@ def test_prohibited_match(data):
             return True
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoMatchRule.message
+            assert_errors(diagnostics, rules.NoMatchRule)
 
         @staticmethod
         def test_prohibited_asynchronous_function_definition(
-            default_linter: Linter,
+            extensive_linter: Linter,
         ) -> None:
             code = """
 @probabilistic_program
@@ -822,16 +763,12 @@ def test_prohibited_asynchronous_function_definition(data):
     async def test_prohibited_asynchronous_function_definition_nested():
         return None
             """
-            default_linter.extensive_diagnosis = True
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            diagnostics = extensive_linter.lint_code(code)
+            assert_errors(
+                diagnostics,
+                rules.NoAsynchronousStatementRule,
+                rules.NoNestedFunctionsRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoAsynchronousStatementRule.message in messages
-            assert rules.NoNestedFunctionsRule.message in messages
 
         @staticmethod
         def test_prohibited_asynchronous_for(default_linter: Linter) -> None:
@@ -851,31 +788,24 @@ def test_prohibited_asynchronous_for(data):
         return True
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoAsynchronousStatementRule.message
-            )
+            assert_errors(diagnostics, rules.NoAsynchronousStatementRule)
 
         @staticmethod
-        def test_prohibited_asynchronous_with(default_linter: Linter) -> None:
+        def test_prohibited_asynchronous_with(
+            extensive_linter: Linter,
+        ) -> None:
             code = """
 @probabilistic_program
 def test_prohibited_asynchronous_with(path):
     async with open(path, "r"):
         return None
             """
-            default_linter.extensive_diagnosis = True
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            diagnostics = extensive_linter.lint_code(code)
+            assert_errors(
+                diagnostics,
+                rules.NoAsynchronousStatementRule,
+                rules.NoWithStatementRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoAsynchronousStatementRule.message in messages
-            assert rules.NoWithStatementRule.message in messages
 
         @staticmethod
         def test_prohibited_pass(default_linter: Linter) -> None:
@@ -885,9 +815,7 @@ def test_prohibited_pass(data):
     pass
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoPassRule.message
+            assert_errors(diagnostics, rules.NoPassRule)
 
         @staticmethod
         def test_valid_return(default_linter: Linter) -> None:
@@ -907,9 +835,7 @@ def test_prohibited_empty_return(data):
     return
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoEmptyReturnRule.message
+            assert_errors(diagnostics, rules.NoEmptyReturnRule)
 
     class TestRestrictedExceptionHandling:
         @staticmethod
@@ -920,9 +846,7 @@ def test_prohibited_raise(data):
     raise RuntimeError("forbidden!")
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoRaiseExceptionRule.message
+            assert_errors(diagnostics, rules.NoRaiseExceptionRule)
 
         @staticmethod
         def test_prohibited_try_except(default_linter: Linter) -> None:
@@ -935,9 +859,7 @@ def test_prohibited_try_except(data):
         return None
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoTryExceptRule.message
+            assert_errors(diagnostics, rules.NoTryExceptRule)
 
         @staticmethod
         def test_prohibited_assert(default_linter: Linter) -> None:
@@ -947,9 +869,7 @@ def test_prohibited_assert(data):
     assert True
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoAssertRule.message
+            assert_errors(diagnostics, rules.NoAssertRule)
 
 
 class TestExpressionLinting:
@@ -964,12 +884,7 @@ def test_restricted_unary_operator_bitwise(n):
     return ~n
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictUnaryOperatorsRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictUnaryOperatorsRule)
 
         @staticmethod
         def test_restricted_binary_operators_shift(
@@ -981,12 +896,7 @@ def test_restricted_binary_operators_shift(n):
     return 1 << n
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictBinaryOperatorsRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictBinaryOperatorsRule)
 
         @staticmethod
         def test_restricted_binary_operators_bitwise(
@@ -1001,14 +911,11 @@ def test_restricted_binary_operators_bitwise(a, b, c, d):
     return result
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 3
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
-            )
-            assert all(
-                diagnostic.message == rules.RestrictBinaryOperatorsRule.message
-                for diagnostic in diagnostics
+            assert_errors(
+                diagnostics,
+                rules.RestrictBinaryOperatorsRule,
+                rules.RestrictBinaryOperatorsRule,
+                rules.RestrictBinaryOperatorsRule,
             )
 
         @staticmethod
@@ -1030,89 +937,56 @@ def test_restricted_comparison_operators(a, b, c, d, e, f, g):
             assert not diagnostics
 
         @staticmethod
-        def test_restricted_comparison_operators_is(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_comparison_operators_is(a, b):
     return a is b
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictComparisonOperatorsRule.message
-            )
-
-        @staticmethod
-        def test_restricted_comparison_operators_is_not(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="is",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_comparison_operators_is_not(a, b):
     return a is not b
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictComparisonOperatorsRule.message
-            )
-
-        @staticmethod
-        def test_restricted_comparison_operators_in(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="is_not",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_comparison_operators_in(a, b):
     return a in b
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictComparisonOperatorsRule.message
-            )
-
-        @staticmethod
-        def test_restricted_comparison_operators_not_in(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="in",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_comparison_operators_not_in(a, b):
     return a not in b
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictComparisonOperatorsRule.message
-            )
-
-        @staticmethod
-        def test_restricted_comparison_operators_multiple(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="not_in",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_comparison_operators_multiple(a, b, c):
     return a < b <= c
-            """
+                    """,
+                    id="multiple",
+                ),
+            ],
+        )
+        def test_restricted_comparison_operators_violated(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictComparisonOperatorsRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictComparisonOperatorsRule)
 
     class TestProhibitedInlineStatements:
         @staticmethod
@@ -1129,9 +1003,7 @@ def test_prohibited_walrus(data):
             )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoWalrusOperatorRule.message
+            assert_errors(diagnostics, rules.NoWalrusOperatorRule)
 
         @staticmethod
         def test_prohibited_lambda(default_linter: Linter) -> None:
@@ -1147,9 +1019,7 @@ def test_prohibited_lambda(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoLambdaRule.message
+            assert_errors(diagnostics, rules.NoLambdaRule)
 
         @staticmethod
         def test_prohibited_inline_if(default_linter: Linter) -> None:
@@ -1169,9 +1039,7 @@ def test_prohibited_inline_if(probability):
     return i
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoInlineIfRule.message
+            assert_errors(diagnostics, rules.NoInlineIfRule)
 
     class TestRestrictedDataStructures:
         @staticmethod
@@ -1197,9 +1065,7 @@ def test_prohibited_dictionary(data):
     return details
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoDictionaryRule.message
+            assert_errors(diagnostics, rules.NoDictionaryRule)
 
         @staticmethod
         def test_prohibited_set(default_linter: Linter) -> None:
@@ -1217,14 +1083,9 @@ def test_prohibited_set(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            assert_errors(
+                diagnostics, rules.NoSetRule, rules.NoStandaloneExpressionRule
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoSetRule.message in messages
-            assert rules.NoStandaloneExpressionRule.message in messages
 
         @staticmethod
         def test_prohibited_comprehension_list(default_linter: Linter) -> None:
@@ -1234,12 +1095,7 @@ def test_prohibited_comprehension_list():
     return [2**n for n in range(10)]
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoComprehensionAndGeneratorRule.message
-            )
+            assert_errors(diagnostics, rules.NoComprehensionAndGeneratorRule)
 
         @staticmethod
         def test_prohibited_comprehension_set(default_linter: Linter) -> None:
@@ -1249,12 +1105,7 @@ def test_prohibited_comprehension_set():
     return {2**n for n in range(10)}
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoComprehensionAndGeneratorRule.message
-            )
+            assert_errors(diagnostics, rules.NoComprehensionAndGeneratorRule)
 
         @staticmethod
         def test_prohibited_comprehension_dictionary(
@@ -1266,12 +1117,7 @@ def test_prohibited_comprehension_dictionary():
     return {n: 2**n for n in range(10)}
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoComprehensionAndGeneratorRule.message
-            )
+            assert_errors(diagnostics, rules.NoComprehensionAndGeneratorRule)
 
         @staticmethod
         def test_prohibited_generator(default_linter: Linter) -> None:
@@ -1281,12 +1127,7 @@ def test_prohibited_generator():
     return sum(2**n for n in range(10))
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoComprehensionAndGeneratorRule.message
-            )
+            assert_errors(diagnostics, rules.NoComprehensionAndGeneratorRule)
 
     class TestRestrictedControlFlowManipulation:
         @staticmethod
@@ -1301,12 +1142,7 @@ def test_prohibited_asynchronous_await(data):
     return False
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.NoAsynchronousExpressionRule.message
-            )
+            assert_errors(diagnostics, rules.NoAsynchronousExpressionRule)
 
         @staticmethod
         def test_prohibited_asynchronous_generator(
@@ -1318,17 +1154,14 @@ def test_prohibited_asynchronous_generator():
     return [Normal(n, n * 0.1) async for n in range(10)]
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            assert_errors(
+                diagnostics,
+                rules.NoAsynchronousExpressionRule,
+                rules.NoComprehensionAndGeneratorRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoAsynchronousExpressionRule.message in messages
-            assert rules.NoComprehensionAndGeneratorRule.message in messages
 
         @staticmethod
-        def test_prohibited_yield(default_linter: Linter) -> None:
+        def test_prohibited_yield(extensive_linter: Linter) -> None:
             code = """
 @probabilistic_program
 def test_prohibited_yield(data):
@@ -1340,34 +1173,26 @@ def test_prohibited_yield(data):
         )
         yield data[i]
             """
-            default_linter.extensive_diagnosis = True
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            diagnostics = extensive_linter.lint_code(code)
+            assert_errors(
+                diagnostics,
+                rules.NoYieldRule,
+                rules.NoStandaloneExpressionRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoYieldRule.message in messages
-            assert rules.NoStandaloneExpressionRule.message in messages
 
         @staticmethod
-        def test_prohibited_yield_from(default_linter: Linter) -> None:
+        def test_prohibited_yield_from(extensive_linter: Linter) -> None:
             code = """
 @probabilistic_program
 def test_prohibited_yield_from(data):
     yield from test_prohibited_yield(data)
             """
-            default_linter.extensive_diagnosis = True
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            diagnostics = extensive_linter.lint_code(code)
+            assert_errors(
+                diagnostics,
+                rules.NoYieldRule,
+                rules.NoStandaloneExpressionRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoYieldRule.message in messages
-            assert rules.NoStandaloneExpressionRule.message in messages
 
     class TestRestrictedSyntax:
         @staticmethod
@@ -1378,9 +1203,7 @@ def test_prohibited_fstring():
     return f"prohibited {'f-string'}!"
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoFstringRule.message
+            assert_errors(diagnostics, rules.NoFstringRule)
 
         @staticmethod
         def test_prohibited_starred(default_linter: Linter) -> None:
@@ -1398,34 +1221,28 @@ def test_prohibited_starred(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert diagnostics[0].message == rules.NoStarredRule.message
+            assert_errors(diagnostics, rules.NoStarredRule)
 
         @staticmethod
         def test_prohibited_type_parameters_alias(
-            default_linter: Linter,
+            extensive_linter: Linter,
         ) -> None:
             code = """
 @probabilistic_program
 def test_prohibited_type_parameters_alias(data):
     type Alias[*Ts] = tuple[*Ts]
             """
-            default_linter.extensive_diagnosis = True
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 3
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            diagnostics = extensive_linter.lint_code(code)
+            assert_errors(
+                diagnostics,
+                rules.NoTypeAliasRule,
+                rules.NoStarredRule,
+                rules.NoTypeParameterRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoTypeAliasRule.message in messages
-            assert rules.NoStarredRule.message in messages
-            assert rules.NoTypeParameterRule.message in messages
 
         @staticmethod
         def test_prohibited_type_parameters_function(
-            default_linter: Linter,
+            extensive_linter: Linter,
         ) -> None:
             code = """
 @probabilistic_program
@@ -1433,16 +1250,12 @@ def test_prohibited_type_parameters_function(data):
     def first[T](l: list[T]) -> T:
         return l[0]
             """
-            default_linter.extensive_diagnosis = True
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 2
-            assert all(
-                diagnostic.severity == Severity.ERROR
-                for diagnostic in diagnostics
+            diagnostics = extensive_linter.lint_code(code)
+            assert_errors(
+                diagnostics,
+                rules.NoNestedFunctionsRule,
+                rules.NoTypeParameterRule,
             )
-            messages = [diagnostic.message for diagnostic in diagnostics]
-            assert rules.NoNestedFunctionsRule.message in messages
-            assert rules.NoTypeParameterRule.message in messages
 
 
 class TestPythiaSpecificLinting:
@@ -1467,12 +1280,7 @@ def test_restricted_sample_structure_incorrect_address_number(data):
     return sample(123, Dirac(True))
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictSampleCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictSampleCallStructureRule)
 
         @staticmethod
         def test_restricted_sample_structure_missing_argument(
@@ -1484,12 +1292,7 @@ def test_restricted_sample_structure_missing_argument(data):
     return sample("p")
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictSampleCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictSampleCallStructureRule)
 
         @staticmethod
         def test_restricted_sample_structure_incorrect_keyword_argument(
@@ -1501,12 +1304,7 @@ def test_restricted_sample_structure_incorrect_keyword_argument(data):
     return sample("p", distribution=Uniform(0, 1))
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictSampleCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictSampleCallStructureRule)
 
     class TestRestrictedObserve:
         @staticmethod
@@ -1522,12 +1320,7 @@ def test_restricted_observe_call_address_number(data):
     return probability
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictObserveCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictObserveCallStructureRule)
 
         @staticmethod
         def test_restricted_observe_call_address_variable(
@@ -1545,12 +1338,7 @@ def test_restricted_observe_call_address_variable(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictObserveCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictObserveCallStructureRule)
 
         @staticmethod
         def test_restricted_observe_structure_two_keyword_arguments(
@@ -1601,12 +1389,7 @@ def test_restrict_observe_structure_incorrect_ordering(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictObserveCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictObserveCallStructureRule)
 
         @staticmethod
         def test_restricted_observe_structure_missing_positional(
@@ -1623,12 +1406,7 @@ def test_restrict_observe_structure_missing_positional(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictObserveCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictObserveCallStructureRule)
 
     class TestRestrictedFactor:
         @staticmethod
@@ -1665,12 +1443,7 @@ def test_restricted_factor_missing_expression():
     factor()
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictFactorCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictFactorCallStructureRule)
 
         @staticmethod
         def test_restricted_factor_additional_argument(
@@ -1682,12 +1455,7 @@ def test_restricted_factor_additional_argument():
     factor(0.123, "address", Beta(0.1, 0.2))
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictFactorCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictFactorCallStructureRule)
 
     class TestRestrictedAddresses:
         @staticmethod
@@ -1719,12 +1487,7 @@ def test_restricted_sample_incorrect_iid_arguments():
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictSampleCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictSampleCallStructureRule)
 
         @staticmethod
         def test_restricted_sample_valid_iid(default_linter: Linter) -> None:
@@ -1755,12 +1518,7 @@ def test_restricted_observe_incorrect_iid_missing_argument(data):
         )
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictObserveCallStructureRule.message
-            )
+            assert_errors(diagnostics, rules.RestrictObserveCallStructureRule)
 
         @staticmethod
         def test_restricted_indexed_address(default_linter: Linter) -> None:
@@ -1811,11 +1569,8 @@ def test_restricted_indexed_address_missing_address(
     return sample(IndexedAddress(21), Normal(0, 1))
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictIndexedAddressCallStructureRule.message
+            assert_errors(
+                diagnostics, rules.RestrictIndexedAddressCallStructureRule
             )
 
         @staticmethod
@@ -1828,153 +1583,142 @@ def test_restricted_indexed_address_missing_number(data):
     return sample(IndexedAddress("i"), Normal(0, 1))
             """
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictIndexedAddressCallStructureRule.message
+            assert_errors(
+                diagnostics, rules.RestrictIndexedAddressCallStructureRule
             )
 
     class TestVectorConstructor:
         @staticmethod
-        def test_restricted_vector_constructor_size(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_vector_constructor_size(data):
     return Vector(12)
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert not diagnostics
-
-        @staticmethod
-        def test_restricted_vector_constructor_size_fill(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="size",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_vector_constructor_size_fill(data):
     return Vector(12, fill=-1)
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert not diagnostics
-
-        @staticmethod
-        def test_restricted_vector_constructor_size_fill_type(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="size_fill",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_vector_constructor_size_fill_type(data):
     return Vector(12, fill=-1, t=int)
-            """
+                    """,
+                    id="size_fill_type",
+                ),
+            ],
+        )
+        def test_restricted_vector_constructor_valid(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
             assert not diagnostics
 
         @staticmethod
-        def test_restricted_vector_constructor_missing_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_vector_constructor_missing_argument(data):
     return Vector()
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictVectorConstructorCallStructureRule.message
-            )
-
-        @staticmethod
-        def test_restricted_vector_constructor_additional_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="missing_argument",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_vector_constructor_additional_argument(data):
     return Vector(12, -1, fill=-1, t=int)
-            """
+                    """,
+                    id="additional_argument",
+                ),
+            ],
+        )
+        def test_restricted_vector_constructor_invalid(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictVectorConstructorCallStructureRule.message
+            assert_errors(
+                diagnostics, rules.RestrictVectorConstructorCallStructureRule
             )
 
     class TestArrayConstructor:
         @staticmethod
-        def test_restricted_array_constructor_size(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_array_constructor_size(data):
     return Array((256, 256, 3))
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert not diagnostics
-
-        @staticmethod
-        def test_restricted_array_constructor_size_fill(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="size",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_array_constructor_size_fill(data):
     return Array((256, 256, 3), fill=-1)
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert not diagnostics
-
-        @staticmethod
-        def test_restricted_array_constructor_size_fill_type(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="size_fill",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_array_constructor_size_fill_type(data):
     return Array((256, 256, 3), fill=-1, t=int)
-            """
+                    """,
+                    id="size_fill_type",
+                ),
+            ],
+        )
+        def test_restricted_array_constructor_valid(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
             assert not diagnostics
 
         @staticmethod
-        def test_restricted_array_constructor_missing_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+        @pytest.mark.parametrize(
+            "code",
+            [
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_array_constructor_missing_argument(data):
     return Array()
-            """
-            diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictArrayConstructorCallStructureRule.message
-            )
-
-        @staticmethod
-        def test_restricted_array_constructor_additional_argument(
-            default_linter: Linter,
-        ) -> None:
-            code = """
+                    """,
+                    id="missing_argument",
+                ),
+                pytest.param(
+                    """
 @probabilistic_program
 def test_restricted_array_constructor_additional_argument(data):
     return Array((256, 256, 3), -1, fill=-1, t=int)
-            """
+                    """,
+                    id="additional_argument",
+                ),
+            ],
+        )
+        def test_restricted_array_constructor_invalid(
+            default_linter: Linter, code: str
+        ) -> None:
             diagnostics = default_linter.lint_code(code)
-            assert len(diagnostics) == 1
-            assert diagnostics[0].severity == Severity.ERROR
-            assert (
-                diagnostics[0].message
-                == rules.RestrictArrayConstructorCallStructureRule.message
+            assert_errors(
+                diagnostics, rules.RestrictArrayConstructorCallStructureRule
             )
 
 
@@ -1988,7 +1732,7 @@ class TestUnrecommendedUseCaseClass:
     """
         diagnostics = default_linter.lint_code(code)
         assert len(diagnostics) == 1
-        assert diagnostics[0].severity == Severity.INFORMATION
+        assert diagnostics[0].severity is Severity.INFORMATION
 
     @staticmethod
     def test_unrecommended_use_case_async_function(
@@ -2001,7 +1745,7 @@ async def test_unrecommended_use_case_async_function():
     """
         diagnostics = default_linter.lint_code(code)
         assert len(diagnostics) == 1
-        assert diagnostics[0].severity == Severity.INFORMATION
+        assert diagnostics[0].severity is Severity.INFORMATION
 
     @staticmethod
     def test_unchecked_if_main(default_linter: Linter) -> None:
@@ -2015,3 +1759,108 @@ raise RuntimeError(message.rsplit(" ", 1)[0] + " usage!")
     """
         diagnostics = default_linter.lint_code(code)
         assert not diagnostics
+        assert default_linter.found_code_outside()
+
+
+class TestCustomRules:
+    @staticmethod
+    def test_rule_only_checks_its_node_types() -> None:
+        checked: list[ast.AST] = []
+
+        class RecordConstantsRule(rules.BaseRule):
+            message = "Constants are recorded"
+            node_types = (ast.Constant,)
+
+            @override
+            @classmethod
+            def check(cls, node: ast.AST) -> Diagnostic | None:
+                checked.append(node)
+                return None
+
+        code = """
+def test_rule_only_checks_its_node_types(data):
+    return data[0] + 1 - 2.0
+    """
+        linter = Linter(
+            [RecordConstantsRule],
+            lambda node: isinstance(node, ast.FunctionDef),
+        )
+        diagnostics = linter.lint_code(code)
+        assert not diagnostics
+        assert len(checked) == 3
+        assert all(isinstance(node, ast.Constant) for node in checked)
+
+    @staticmethod
+    def test_gate_skips_rules() -> None:
+        checked: list[ast.AST] = []
+
+        class RecordAllRule(rules.BaseRule):
+            message = "Nodes are recorded"
+            node_types = (ast.AST,)
+
+            @override
+            @classmethod
+            def check(cls, node: ast.AST) -> Diagnostic | None:
+                checked.append(node)
+                return cls.diagnostic(node)
+
+        code = """
+def test_gate_skips_rules(data):
+    return data[0] + 1
+    """
+        linter = Linter(
+            [RecordAllRule],
+            lambda _: True,
+            may_contain_entry_point=lambda _: False,
+        )
+        diagnostics = linter.lint_code(code)
+        assert not diagnostics
+        assert not checked
+        assert linter.found_code_outside()
+
+    @staticmethod
+    def test_default_gate_lints_decorated_code(default_linter: Linter) -> None:
+        code = """
+@ probabilistic_program
+def test_default_gate_lints_decorated_code(data):
+    message = f"{data}"
+    return message
+    """
+        diagnostics = default_linter.lint_code(code)
+        assert_errors(diagnostics, rules.NoFstringRule)
+        assert not default_linter.found_code_outside()
+
+    @staticmethod
+    def test_changed_rules_are_applied() -> None:
+        code = """
+def test_changed_rules_are_applied(data):
+    message = f"{data}"
+    return lambda: message
+    """
+        linter = Linter([], lambda node: isinstance(node, ast.FunctionDef))
+        assert not linter.lint_code(code)
+        linter.rules.append(rules.NoFstringRule)
+        assert_errors(linter.lint_code(code), rules.NoFstringRule)
+        linter.rules = [rules.NoLambdaRule]
+        assert_errors(linter.lint_code(code), rules.NoLambdaRule)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "rule",
+        default_probabilistic_program_linter().rules,
+        ids=lambda rule: rule.__name__,
+    )
+    def test_rule_flags_only_its_node_types(
+        snippet_nodes: list[ast.AST], rule: type[rules.BaseRule]
+    ) -> None:
+        for node in snippet_nodes:
+            if rule.check(node) is not None:
+                assert isinstance(node, rule.node_types)
+
+    @staticmethod
+    def test_rule_diagnostic_references_rule() -> None:
+        node = ast.parse("print(f'{1}')").body[0]
+        diagnostic = rules.NoFstringRule.diagnostic(node)
+        assert diagnostic.rule is rules.NoFstringRule
+        assert diagnostic.message == rules.NoFstringRule.message
+        assert diagnostic.severity is Severity.ERROR
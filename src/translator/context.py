@@ -8,7 +8,7 @@ details.
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from itertools import chain
+from itertools import chain, count
 from typing import TYPE_CHECKING, ClassVar, override
 
 # Import `Translator` only for the language-server and any linters since
@@ -67,7 +67,7 @@ class Context:
     _preamble: list[str] = field(default_factory=list, init=False)
     _postamble: list[str] = field(default_factory=list, init=False)
 
-    _unique_address_counter: ClassVar[int] = 0
+    _unique_address_counter: ClassVar[Iterator[int]] = count(1)
 
     @staticmethod
     def unique_address() -> str:
@@ -76,8 +76,8 @@ class Context:
         Returns:
             A unique address compared to previous calls.
         """
-        Context._unique_address_counter += 1
-        return f"__context__unique_address_{Context._unique_address_counter}"
+        number = next(Context._unique_address_counter)
+        return f"__context__unique_address_{number}"
 
     def consolidated(self) -> str:
         """Get the consolidated resulting code.